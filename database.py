@@ -1,40 +1,94 @@
+import atexit
 import sqlite3
 import os
+import pathlib
 from contextlib import contextmanager
 
+# Resolve the database path once at import time, anchored next to the
+# source file rather than the working directory, so every invocation
+# opens the same database (and its WAL sidecar files). Override with
+# the CODE_SYNC_DB environment variable.
+DB_PATH = str(
+    pathlib.Path(os.environ["CODE_SYNC_DB"]).resolve()
+    if "CODE_SYNC_DB" in os.environ
+    else pathlib.Path(__file__).with_name("employee_management.db").resolve()
+)
+
 class DatabaseConnection:
     def __init__(self):
         # SQLite database file path
-        self.db_path = os.path.join(os.getcwd(), "employee_management.db")
-        
+        self.db_path = DB_PATH
+        # Single cached connection, created lazily and reused for the
+        # process lifetime (SQLite is file-based, so a "pool of one"
+        # avoids the open/close cost on every operation)
+        self._conn = None
+
     def get_connection(self):
-        """Get a SQLite database connection"""
+        """Get the shared SQLite database connection, creating it on first use"""
+        if self._conn is not None:
+            return self._conn
         try:
-            conn = sqlite3.connect(self.db_path)
+            # cached_statements keeps compiled statements around so
+            # repeated queries skip the parse/plan step entirely;
+            # isolation_level=None disables the DB-API's implicit BEGIN
+            # so transactions only start where transaction() says so
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=512, isolation_level=None)
             conn.row_factory = sqlite3.Row  # Enable dictionary-like access to rows
+            # Tune the connection once for local single-process use:
+            # WAL + synchronous=NORMAL cuts the fsyncs per commit while
+            # keeping committed transactions durable, and the larger
+            # cache/mmap settings keep hot pages out of the syscall path
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")   # 64 MB page cache
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MB mmap I/O
+            self._conn = conn
+            atexit.register(conn.close)
             return conn
         except sqlite3.Error as e:
             print(f"Error connecting to database: {e}")
             raise
-    
+
     @contextmanager
     def get_cursor(self, dict_cursor=True):
-        """Context manager for database cursor"""
-        conn = None
+        """Context manager for a cursor on the shared connection
+
+        The connection runs in autocommit mode, so reads never pay a
+        BEGIN/COMMIT and single writes commit themselves. Use
+        transaction() to group several statements into one commit.
+        """
+        cursor = self.get_connection().cursor()
+        try:
+            yield cursor, self._conn
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            raise
+        finally:
+            cursor.close()
+
+    @contextmanager
+    def transaction(self):
+        """Context manager running a block of statements in one transaction
+
+        All statements executed on the yielded cursor share a single
+        BEGIN IMMEDIATE ... COMMIT, so a multi-row insert pays one fsync
+        instead of one per row. Rolls back on any exception.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
             yield cursor, conn
             conn.commit()
         except sqlite3.Error as e:
-            if conn:
-                conn.rollback()
+            conn.rollback()
             print(f"Database error: {e}")
             raise
         finally:
-            if conn:
-                conn.close()
-    
+            cursor.close()
+
     def create_tables(self):
         """Create the employee table if it doesn't exist"""
         create_table_query = """
@@ -50,9 +104,40 @@ class DatabaseConnection:
         """
         
         try:
-            with self.get_cursor(dict_cursor=False) as (cursor, conn):
+            # One transaction for the table plus its indexes: a single
+            # commit instead of one per DDL statement
+            with self.transaction() as (cursor, conn):
                 cursor.execute(create_table_query)
-                print("Employee table created successfully or already exists.")
+                # Index the hot lookup columns so designation filters and
+                # email uniqueness checks are range scans, not full scans
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_employees_designation ON employees(designation)"
+                )
+                cursor.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_employees_email ON employees(email)"
+                )
+            print("Employee table created successfully or already exists.")
+            if __debug__:
+                self._audit_query_plans()
         except sqlite3.Error as e:
             print(f"Error creating table: {e}")
             raise
+
+    def _audit_query_plans(self):
+        """Assert the hot designation queries still use their index
+
+        Developer-mode insurance: if a schema edit ever drops or shadows
+        idx_employees_designation, EXPLAIN QUERY PLAN shows a table scan
+        and this fails loudly at startup instead of at customer scale.
+        """
+        from employee_manager import SQL_SELECT_BY_DES, SQL_UPDATE_SALARY_FIXED
+
+        with self.get_cursor() as (cursor, conn):
+            for query in (SQL_SELECT_BY_DES, SQL_UPDATE_SALARY_FIXED):
+                plan = cursor.execute(
+                    "EXPLAIN QUERY PLAN " + query, ("x",) * query.count("?")
+                ).fetchall()
+                # Plans read "USING INDEX ..." or "USING COVERING INDEX ...";
+                # a plain "SCAN employees" has no INDEX mention at all
+                assert any("INDEX" in row[-1] for row in plan), \
+                    f"query plan regressed to a full scan: {query}\n{[tuple(r) for r in plan]}"
@@ -0,0 +1,301 @@
+import sqlite3
+from collections import namedtuple
+from itertools import chain
+from database import DatabaseConnection
+from models import Employee
+
+# Lightweight row type for hot read paths: cheaper to build and faster
+# to access than sqlite3.Row, and it JSON-encodes/pickles trivially.
+# Field order matches the employees table definition.
+EmployeeTuple = namedtuple('EmployeeTuple', 'id first_name last_name email contact designation salary')
+
+def employee_row_factory(cursor, row):
+    """Row factory producing EmployeeTuple instead of sqlite3.Row"""
+    return EmployeeTuple(*row)
+
+# Module-level SQL constants: passing the same string object to execute
+# on every call lets sqlite3's statement cache hit by identity, skipping
+# the re-parse/re-plan cost for these hot queries
+SQL_INSERT = """INSERT INTO employees (first_name, last_name, email, contact, designation, salary)
+                VALUES (?, ?, ?, ?, ?, ?)"""
+SQL_SELECT_ALL = "SELECT * FROM employees ORDER BY id"
+SQL_SELECT_BY_ID = "SELECT * FROM employees WHERE id = ?"
+SQL_SELECT_BY_DES = "SELECT * FROM employees WHERE designation = ? ORDER BY id"
+SQL_UPDATE_DETAILS = """UPDATE employees
+                        SET first_name = ?, last_name = ?, email = ?, contact = ?, designation = ?, salary = ?
+                        WHERE id = ?"""
+SQL_UPDATE_SALARY_FIXED = "UPDATE employees SET salary = salary + ? WHERE designation = ? RETURNING *"
+SQL_UPDATE_SALARY_PCT = "UPDATE employees SET salary = salary * (1 + ? / 100.0) WHERE designation = ? RETURNING *"
+SQL_DELETE = "DELETE FROM employees WHERE id = ?"
+SQL_DESIGNATION_COUNTS = """SELECT designation, COUNT(*) AS count, SUM(salary) AS total_salary, AVG(salary) AS avg_salary
+                            FROM employees GROUP BY designation ORDER BY designation"""
+SQL_SALARY_TOTALS = "SELECT COUNT(*) AS count, SUM(salary) AS total_salary FROM employees"
+SQL_DESIGNATION_SUMMARY = "SELECT designation, COUNT(*) FROM employees GROUP BY designation ORDER BY designation"
+
+class EmployeeManager:
+    """Manages employee database operations"""
+
+    def __init__(self, db=None):
+        # Share a single DatabaseConnection so the whole app reuses one
+        # cached SQLite connection
+        self.db = db if db is not None else DatabaseConnection()
+
+    def register_employee(self):
+        """Register a new employee from console input"""
+        try:
+            first_name = input("Enter first name: ").strip()
+            last_name = input("Enter last name: ").strip()
+            email = input("Enter email: ").strip()
+            contact = input("Enter contact number: ").strip()
+            designation = input("Enter designation: ").strip()
+            salary = float(input("Enter salary (₹): ").strip())
+
+            if not all([first_name, last_name, email, contact, designation]):
+                print("All fields are required!")
+                return
+
+            employee = Employee(first_name, last_name, email, contact, designation, salary)
+
+            # Bind the validated float directly: the column is REAL, so
+            # routing it through the model's Decimal and back adds
+            # conversions without changing the stored value
+            with self.db.transaction() as (cursor, conn):
+                cursor.execute(
+                    SQL_INSERT,
+                    (employee.first_name, employee.last_name, employee.email,
+                     employee.contact, employee.designation, salary)
+                )
+            print(f"\nEmployee {employee.full_name} registered successfully!")
+        except ValueError:
+            print("Invalid salary! Please enter a number.")
+        except sqlite3.IntegrityError:
+            print("An employee with this email already exists!")
+        except sqlite3.Error as e:
+            print(f"Error registering employee: {e}")
+
+    def get_all_employees(self):
+        """Get all employees from the database"""
+        try:
+            with self.db.get_cursor() as (cursor, conn):
+                cursor.row_factory = employee_row_factory
+                cursor.execute(SQL_SELECT_ALL)
+                return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error fetching employees: {e}")
+            return []
+
+    def iter_employees(self, chunk=200):
+        """Yield employees a page at a time instead of materializing the table
+
+        Keeps peak memory at one fetchmany page regardless of table size,
+        and lets display code start printing while rows are still being read.
+        """
+        try:
+            with self.db.get_cursor() as (cursor, conn):
+                cursor.row_factory = employee_row_factory
+                cursor.execute(SQL_SELECT_ALL)
+                while rows := cursor.fetchmany(chunk):
+                    yield from rows
+        except sqlite3.Error as e:
+            print(f"Error fetching employees: {e}")
+
+    def get_employees_by_designation(self, designation):
+        """Get all employees with a given designation"""
+        try:
+            with self.db.get_cursor() as (cursor, conn):
+                cursor.row_factory = employee_row_factory
+                cursor.execute(SQL_SELECT_BY_DES, (designation,))
+                return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error fetching employees: {e}")
+            return []
+
+    def get_designation_counts(self):
+        """Get per-designation count, total and average salary in one query
+
+        The grouping and arithmetic run inside SQLite instead of
+        materializing every row into Python just to aggregate it.
+        """
+        try:
+            with self.db.get_cursor() as (cursor, conn):
+                cursor.execute(SQL_DESIGNATION_COUNTS)
+                return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error fetching designation counts: {e}")
+            return []
+
+    def get_designation_summary(self):
+        """Get [(designation, count), ...] via one grouped SELECT
+
+        Cheaper than get_designation_counts when the caller only needs
+        the distinct designations and their headcounts — the query reads
+        just the designation index, no salary columns.
+        """
+        try:
+            with self.db.get_cursor() as (cursor, conn):
+                cursor.row_factory = None  # plain tuples
+                cursor.execute(SQL_DESIGNATION_SUMMARY)
+                return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error fetching designation summary: {e}")
+            return []
+
+    def get_salary_totals(self):
+        """Get the overall employee count and total salary expense"""
+        try:
+            with self.db.get_cursor() as (cursor, conn):
+                cursor.execute(SQL_SALARY_TOTALS)
+                row = cursor.fetchone()
+                return row['count'], row['total_salary'] or 0
+        except sqlite3.Error as e:
+            print(f"Error fetching salary totals: {e}")
+            return 0, 0
+
+    def display_employees_table(self, employees, title="Employees"):
+        """Display employees from a list or iterator in a formatted table
+
+        Emits rows as they arrive, so streaming sources (iter_employees)
+        never have to be collected into a list first. Returns the number
+        of rows displayed.
+        """
+        rows = iter(employees)
+        try:
+            first = next(rows)
+        except StopIteration:
+            print("No employees to display.")
+            return 0
+
+        print(f"\n{title}")
+        print("-" * 100)
+        print(f"{'ID':<5}{'Name':<25}{'Email':<30}{'Contact':<15}{'Designation':<15}{'Salary':>10}")
+        print("-" * 100)
+        displayed = 0
+        for emp in chain([first], rows):
+            name = f"{emp.first_name} {emp.last_name}"
+            print(f"{emp.id:<5}{name:<25}{emp.email:<30}{emp.contact:<15}"
+                  f"{emp.designation:<15}{emp.salary:>10,.2f}")
+            displayed += 1
+        print("-" * 100)
+        return displayed
+
+    def update_employee_details(self, emp_id):
+        """Update details of an existing employee"""
+        try:
+            with self.db.get_cursor() as (cursor, conn):
+                cursor.execute(SQL_SELECT_BY_ID, (emp_id,))
+                employee = cursor.fetchone()
+
+            if not employee:
+                print(f"No employee found with ID {emp_id}!")
+                return
+
+            print("\nLeave a field blank to keep its current value.")
+            first_name = input(f"First name [{employee['first_name']}]: ").strip() or employee['first_name']
+            last_name = input(f"Last name [{employee['last_name']}]: ").strip() or employee['last_name']
+            email = input(f"Email [{employee['email']}]: ").strip() or employee['email']
+            contact = input(f"Contact [{employee['contact']}]: ").strip() or employee['contact']
+            designation = input(f"Designation [{employee['designation']}]: ").strip() or employee['designation']
+            salary_input = input(f"Salary [{employee['salary']}]: ").strip()
+            salary = float(salary_input) if salary_input else employee['salary']
+
+            with self.db.transaction() as (cursor, conn):
+                cursor.execute(
+                    SQL_UPDATE_DETAILS,
+                    (first_name, last_name, email, contact, designation, salary, emp_id)
+                )
+            print(f"\nEmployee ID {emp_id} updated successfully!")
+        except ValueError:
+            print("Invalid salary! Please enter a number.")
+        except sqlite3.IntegrityError:
+            print("An employee with this email already exists!")
+        except sqlite3.Error as e:
+            print(f"Error updating employee: {e}")
+
+    def delete_employee(self, emp_id):
+        """Delete an employee by ID"""
+        try:
+            with self.db.get_cursor() as (cursor, conn):
+                cursor.execute(SQL_DELETE, (emp_id,))
+                if cursor.rowcount == 0:
+                    print(f"No employee found with ID {emp_id}!")
+                else:
+                    print(f"\nEmployee ID {emp_id} deleted successfully!")
+        except sqlite3.Error as e:
+            print(f"Error deleting employee: {e}")
+
+    def update_salary_by_designation(self, designation, value, is_percentage):
+        """Update salaries for all employees with a given designation
+
+        Runs a single UPDATE ... RETURNING * and returns the updated
+        rows, so callers can display the result without a second SELECT.
+        """
+        try:
+            with self.db.get_cursor() as (cursor, conn):
+                cursor.row_factory = employee_row_factory
+                if is_percentage:
+                    cursor.execute(SQL_UPDATE_SALARY_PCT, (value, designation))
+                else:
+                    cursor.execute(SQL_UPDATE_SALARY_FIXED, (value, designation))
+                return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error updating salaries: {e}")
+            return []
+
+    # SQLite caps bound parameters at 999 by default; 83 rows of 6
+    # columns keeps each batched INSERT safely under that limit
+    BULK_INSERT_CHUNK = 500 // 6
+
+    def bulk_insert(self, employees):
+        """Insert many employee tuples with batched multi-row INSERTs
+
+        Expands each INSERT to carry up to BULK_INSERT_CHUNK rows in one
+        VALUES clause, all inside a single transaction, so large loads
+        (demo seeding, CSV import) avoid per-row statement dispatch.
+        Returns the number of rows inserted.
+        """
+        if not employees:
+            return 0
+        try:
+            inserted = 0
+            with self.db.transaction() as (cursor, conn):
+                for start in range(0, len(employees), self.BULK_INSERT_CHUNK):
+                    chunk = employees[start:start + self.BULK_INSERT_CHUNK]
+                    sql = (
+                        "INSERT OR IGNORE INTO employees (first_name, last_name, email, contact, designation, salary) VALUES "
+                        + ",".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk))
+                    )
+                    args = [value for row in chunk for value in row]
+                    cursor.execute(sql, args)
+                    inserted += cursor.rowcount
+            return inserted
+        except sqlite3.Error as e:
+            print(f"Error inserting employees: {e}")
+            return 0
+
+    def insert_demo_employees(self):
+        """Insert demo employee records for testing"""
+        demo_employees = [
+            ("Aarav", "Sharma", "aarav.sharma@example.com", "9876543210", "Developer", 55000.00),
+            ("Priya", "Patel", "priya.patel@example.com", "9876543211", "Developer", 60000.00),
+            ("Rohan", "Gupta", "rohan.gupta@example.com", "9876543212", "Manager", 85000.00),
+            ("Ananya", "Singh", "ananya.singh@example.com", "9876543213", "Designer", 48000.00),
+            ("Vikram", "Kumar", "vikram.kumar@example.com", "9876543214", "Developer", 58000.00),
+            ("Sneha", "Reddy", "sneha.reddy@example.com", "9876543215", "Tester", 42000.00),
+            ("Arjun", "Mehta", "arjun.mehta@example.com", "9876543216", "Manager", 90000.00),
+            ("Kavya", "Joshi", "kavya.joshi@example.com", "9876543217", "Designer", 50000.00),
+            ("Aditya", "Verma", "aditya.verma@example.com", "9876543218", "Tester", 44000.00),
+            ("Ishita", "Nair", "ishita.nair@example.com", "9876543219", "Developer", 62000.00),
+            ("Karan", "Malhotra", "karan.malhotra@example.com", "9876543220", "HR", 52000.00),
+            ("Divya", "Iyer", "divya.iyer@example.com", "9876543221", "HR", 54000.00),
+        ]
+
+        inserted = self.bulk_insert(demo_employees)
+        if inserted:
+            # Refresh planner statistics so the new rows are reflected
+            # in index selection
+            try:
+                with self.db.get_cursor() as (cursor, conn):
+                    cursor.execute("ANALYZE")
+            except sqlite3.Error as e:
+                print(f"Error analyzing database: {e}")
+        print(f"\nInserted {inserted} demo employees successfully!")
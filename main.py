@@ -4,38 +4,45 @@ Employee Data Management System
 A console application for managing employee data with SQLite database operations
 """
 
+import functools
 import sys
-from decimal import Decimal
-from database import DatabaseConnection
-from employee_manager import EmployeeManager
+
+# Header and menu text is identical on every render, so build each block
+# once at import and emit it with a single write instead of a dozen
+# print calls per loop iteration
+_HEADER = "\n" + "=" * 60 + "\n" + " " * 15 + "EMPLOYEE DATA MANAGEMENT SYSTEM\n" + "=" * 60 + "\n"
+_MENU = (
+    "\n" + "=" * 40 + "\n"
+    "           MAIN MENU\n"
+    + "=" * 40 + "\n"
+    "1. Register New Employee\n"
+    "2. View All Employees\n"
+    "3. View Employees by Designation\n"
+    "4. Update Employee Details\n"
+    "5. Delete Employee\n"
+    "6. Update Salaries by Designation\n"
+    "7. Insert Demo Data\n"
+    "8. Employee Summary Statistics\n"
+    "9. Exit\n"
+    + "=" * 40 + "\n"
+)
 
 def print_header():
     """Print application header"""
-    print("\n" + "=" * 60)
-    print(" " * 15 + "EMPLOYEE DATA MANAGEMENT SYSTEM")
-    print("=" * 60)
+    sys.stdout.write(_HEADER)
+
+@functools.lru_cache(maxsize=None)
+def _section_header(title):
+    """Build (and memoize) the banner for a section title"""
+    return f"\n{'-' * 60}\n {title}\n{'-' * 60}\n"
 
 def print_section_header(title):
     """Print section header"""
-    print(f"\n{'-' * 60}")
-    print(f" {title}")
-    print(f"{'-' * 60}")
+    sys.stdout.write(_section_header(title))
 
 def print_menu():
     """Print main menu options"""
-    print("\n" + "=" * 40)
-    print("           MAIN MENU")
-    print("=" * 40)
-    print("1. Register New Employee")
-    print("2. View All Employees")
-    print("3. View Employees by Designation")
-    print("4. Update Employee Details")
-    print("5. Delete Employee")
-    print("6. Update Salaries by Designation")
-    print("7. Insert Demo Data")
-    print("8. Employee Summary Statistics")
-    print("9. Exit")
-    print("=" * 40)
+    sys.stdout.write(_MENU)
 
 def get_user_choice():
     """Get and validate user menu choice"""
@@ -64,23 +71,20 @@ def handle_salary_updates(employee_manager):
     if choice == '3':
         return
     elif choice in ['1', '2']:
-        # Get all unique designations
-        all_employees = employee_manager.get_all_employees()
-        if not all_employees:
+        # One grouped query gives every designation with its headcount
+        designations = employee_manager.get_designation_summary()
+        if not designations:
             print("No employees found!")
             return
-            
-        designations = list(set(emp['designation'] for emp in all_employees))
-        
+
         print("\nAvailable Designations:")
-        for i, designation in enumerate(designations, 1):
-            count = len([emp for emp in all_employees if emp['designation'] == designation])
+        for i, (designation, count) in enumerate(designations, 1):
             print(f"{i}. {designation} ({count} employees)")
-            
+
         try:
             des_choice = int(input("\nSelect designation: ")) - 1
             if 0 <= des_choice < len(designations):
-                selected_designation = designations[des_choice]
+                selected_designation = designations[des_choice][0]
                 
                 # Show current employees
                 current_employees = employee_manager.get_employees_by_designation(selected_designation)
@@ -88,16 +92,15 @@ def handle_salary_updates(employee_manager):
                 
                 if choice == '1':  # Fixed amount
                     amount = float(input(f"\nEnter amount to add (₹): "))
-                    updated_count = employee_manager.update_salary_by_designation(selected_designation, Decimal(str(amount)), False)
-                    print(f"\nUpdated salaries for {updated_count} {selected_designation} employees (added ₹{amount:,.2f})")
+                    updated_employees = employee_manager.update_salary_by_designation(selected_designation, amount, False)
+                    print(f"\nUpdated salaries for {len(updated_employees)} {selected_designation} employees (added ₹{amount:,.2f})")
                 else:  # Percentage
                     percentage = float(input(f"\nEnter percentage to add (%): "))
-                    updated_count = employee_manager.update_salary_by_designation(selected_designation, Decimal(str(percentage)), True)
-                    print(f"\nUpdated salaries for {updated_count} {selected_designation} employees (added {percentage}%)")
-                
-                # Show updated employees
-                if updated_count > 0:
-                    updated_employees = employee_manager.get_employees_by_designation(selected_designation)
+                    updated_employees = employee_manager.update_salary_by_designation(selected_designation, percentage, True)
+                    print(f"\nUpdated salaries for {len(updated_employees)} {selected_designation} employees (added {percentage}%)")
+
+                # The UPDATE already returned the new rows — no second SELECT
+                if updated_employees:
                     employee_manager.display_employees_table(updated_employees, f"{selected_designation} Employees - After Update")
                     
             else:
@@ -109,22 +112,19 @@ def handle_salary_updates(employee_manager):
 
 def handle_view_by_designation(employee_manager):
     """Handle viewing employees by designation"""
-    all_employees = employee_manager.get_all_employees()
-    if not all_employees:
+    designations = employee_manager.get_designation_summary()
+    if not designations:
         print("No employees found!")
         return
-        
-    designations = list(set(emp['designation'] for emp in all_employees))
-    
+
     print("\nAvailable Designations:")
-    for i, designation in enumerate(designations, 1):
-        count = len([emp for emp in all_employees if emp['designation'] == designation])
+    for i, (designation, count) in enumerate(designations, 1):
         print(f"{i}. {designation} ({count} employees)")
-        
+
     try:
         choice = int(input("\nSelect designation to view: ")) - 1
         if 0 <= choice < len(designations):
-            selected_designation = designations[choice]
+            selected_designation = designations[choice][0]
             employees = employee_manager.get_employees_by_designation(selected_designation)
             employee_manager.display_employees_table(employees, f"{selected_designation} Employees")
         else:
@@ -150,112 +150,172 @@ def handle_delete_employee(employee_manager):
 
 def show_statistics(employee_manager):
     """Show employee statistics"""
-    employees = employee_manager.get_all_employees()
-    if not employees:
+    # Aggregate inside SQLite rather than pulling every row into Python
+    designation_counts = employee_manager.get_designation_counts()
+    if not designation_counts:
         print("No employees found!")
         return
-        
+
     print_section_header("EMPLOYEE SUMMARY STATISTICS")
-    
-    designations = {}
-    total_salary = Decimal("0")
-    
-    for emp in employees:
-        designation = emp['designation']
-        salary = Decimal(str(emp['salary']))
-        
-        if designation not in designations:
-            designations[designation] = {'count': 0, 'total_salary': Decimal("0")}
-        
-        designations[designation]['count'] += 1
-        designations[designation]['total_salary'] += salary
-        total_salary += salary
-    
-    print(f"\nTotal Employees: {len(employees)}")
+
+    total_count, total_salary = employee_manager.get_salary_totals()
+    print(f"\nTotal Employees: {total_count}")
     print(f"Total Salary Expense: ₹{total_salary:,.2f}")
     print("\nBreakdown by Designation:")
-    
-    for designation, data in designations.items():
-        avg_salary = data['total_salary'] / data['count']
-        print(f"  {designation}: {data['count']} employees, "
-              f"Total: ₹{data['total_salary']:,.2f}, "
-              f"Average: ₹{avg_salary:,.2f}")
+
+    for row in designation_counts:
+        print(f"  {row['designation']}: {row['count']} employees, "
+              f"Total: ₹{row['total_salary']:,.2f}, "
+              f"Average: ₹{row['avg_salary']:,.2f}")
+
+def handle_register(employee_manager):
+    """Handle registering a new employee"""
+    employee_manager.register_employee()
+
+def handle_view_all(employee_manager):
+    """Handle viewing all employees"""
+    employee_manager.display_employees_table(employee_manager.iter_employees(), "All Employees")
+
+def handle_update_with_listing(employee_manager):
+    """Show all employees for reference, then handle an update"""
+    if employee_manager.display_employees_table(employee_manager.iter_employees(), "Current Employees"):
+        handle_update_employee(employee_manager)
+    else:
+        print("No employees found!")
+
+def handle_delete_with_listing(employee_manager):
+    """Show all employees for reference, then handle a deletion"""
+    if employee_manager.display_employees_table(employee_manager.iter_employees(), "Current Employees"):
+        handle_delete_employee(employee_manager)
+    else:
+        print("No employees found!")
+
+def handle_insert_demo(employee_manager):
+    """Handle inserting demo data after confirmation"""
+    confirm = input("This will insert 12 demo employees. Continue? (y/n): ").strip().lower()
+    if confirm == 'y':
+        employee_manager.insert_demo_employees()
+    else:
+        print("Demo data insertion cancelled.")
+
+# Menu dispatch table: choice -> (section title, handler). A dict lookup
+# replaces the 8-way if/elif chain and keeps each choice's setup in one
+# place. A None title means the handler prints its own header.
+DISPATCH = {
+    '1': ("EMPLOYEE REGISTRATION", handle_register),
+    '2': ("ALL EMPLOYEE RECORDS", handle_view_all),
+    '3': ("VIEW BY DESIGNATION", handle_view_by_designation),
+    '4': ("UPDATE EMPLOYEE DETAILS", handle_update_with_listing),
+    '5': ("DELETE EMPLOYEE", handle_delete_with_listing),
+    '6': ("SALARY UPDATES", handle_salary_updates),
+    '7': ("INSERT DEMO DATA", handle_insert_demo),
+    '8': (None, show_statistics),
+}
+
+def run_script(employee_manager, script_path):
+    """Run commands from a script file, one per line, without the menu
+
+    Supported commands: seed-demo, view-all, view-designation <name>,
+    raise-fixed <name> <amount>, raise-percent <name> <percent>,
+    delete <id>, stats. Blank lines and lines starting with # are skipped.
+    """
+    try:
+        with open(script_path) as script:
+            lines = script.readlines()
+    except OSError as e:
+        print(f"Error reading script file: {e}")
+        sys.exit(1)
+
+    for line in lines:
+        parts = line.split()
+        if not parts or parts[0].startswith('#'):
+            continue
+        command, args = parts[0], parts[1:]
+        try:
+            if command == 'seed-demo':
+                employee_manager.insert_demo_employees()
+            elif command == 'view-all':
+                employee_manager.display_employees_table(employee_manager.iter_employees(), "All Employees")
+            elif command == 'view-designation':
+                employee_manager.display_employees_table(
+                    employee_manager.get_employees_by_designation(args[0]), f"{args[0]} Employees")
+            elif command == 'raise-fixed':
+                updated = employee_manager.update_salary_by_designation(args[0], float(args[1]), False)
+                print(f"Updated {len(updated)} {args[0]} employees")
+            elif command == 'raise-percent':
+                updated = employee_manager.update_salary_by_designation(args[0], float(args[1]), True)
+                print(f"Updated {len(updated)} {args[0]} employees")
+            elif command == 'delete':
+                employee_manager.delete_employee(int(args[0]))
+            elif command == 'stats':
+                show_statistics(employee_manager)
+            else:
+                print(f"Unknown command: {command}")
+        except (IndexError, ValueError):
+            print(f"Invalid arguments for command: {line.strip()}")
+
+def parse_args():
+    """Parse command-line arguments"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Employee Data Management System")
+    parser.add_argument('--seed-demo', action='store_true',
+                        help="insert the demo employees and exit (no interactive menu)")
+    parser.add_argument('--exec', dest='script', metavar='FILE',
+                        help="run commands from FILE and exit (no interactive menu)")
+    return parser.parse_args()
 
 def main():
     """Main application function with interactive menu"""
+    args = parse_args()
+
+    # Deferred imports: short-lived invocations (--help, scripted runs
+    # that fail argument parsing) never pay for the database stack
+    from database import DatabaseConnection
+    from employee_manager import EmployeeManager
+
+    # Batched/scripted mode: dispatch straight to the manager without
+    # any menu rendering or input() round-trips
+    if args.seed_demo or args.script:
+        db = DatabaseConnection()
+        employee_manager = EmployeeManager(db)
+        db.create_tables()
+        if args.seed_demo:
+            employee_manager.insert_demo_employees()
+        if args.script:
+            run_script(employee_manager, args.script)
+        return
+
     try:
         print_header()
-        
+
         # Initialize database connection and employee manager
         print("\nInitializing SQLite database connection...")
         db = DatabaseConnection()
-        employee_manager = EmployeeManager()
-        
+        employee_manager = EmployeeManager(db)
+
         # Create tables
         print("Creating employee table...")
         db.create_tables()
         print("Database initialized successfully!")
-        
+
         # Main application loop
         while True:
             print_menu()
             choice = get_user_choice()
-            
-            if choice == '1':  # Register New Employee
-                print_section_header("EMPLOYEE REGISTRATION")
-                employee_manager.register_employee()
-                
-            elif choice == '2':  # View All Employees
-                print_section_header("ALL EMPLOYEE RECORDS")
-                all_employees = employee_manager.get_all_employees()
-                employee_manager.display_employees_table(all_employees, "All Employees")
-                
-            elif choice == '3':  # View Employees by Designation
-                print_section_header("VIEW BY DESIGNATION")
-                handle_view_by_designation(employee_manager)
-                
-            elif choice == '4':  # Update Employee Details
-                print_section_header("UPDATE EMPLOYEE DETAILS")
-                # First show all employees for reference
-                all_employees = employee_manager.get_all_employees()
-                if all_employees:
-                    employee_manager.display_employees_table(all_employees, "Current Employees")
-                    handle_update_employee(employee_manager)
-                else:
-                    print("No employees found!")
-                    
-            elif choice == '5':  # Delete Employee
-                print_section_header("DELETE EMPLOYEE")
-                # First show all employees for reference
-                all_employees = employee_manager.get_all_employees()
-                if all_employees:
-                    employee_manager.display_employees_table(all_employees, "Current Employees")
-                    handle_delete_employee(employee_manager)
-                else:
-                    print("No employees found!")
-                    
-            elif choice == '6':  # Update Salaries by Designation
-                print_section_header("SALARY UPDATES")
-                handle_salary_updates(employee_manager)
-                
-            elif choice == '7':  # Insert Demo Data
-                print_section_header("INSERT DEMO DATA")
-                confirm = input("This will insert 12 demo employees. Continue? (y/n): ").strip().lower()
-                if confirm == 'y':
-                    employee_manager.insert_demo_employees()
-                else:
-                    print("Demo data insertion cancelled.")
-                    
-            elif choice == '8':  # Employee Summary Statistics
-                show_statistics(employee_manager)
-                
-            elif choice == '9':  # Exit
+
+            if choice == '9':  # Exit
                 print("\n" + "=" * 60)
                 print(" " * 20 + "THANK YOU FOR USING THE SYSTEM")
                 print("=" * 60)
                 print("Application closed successfully.")
                 break
-                
+
+            title, handler = DISPATCH[choice]
+            if title:
+                print_section_header(title)
+            handler(employee_manager)
+
             # Pause before showing menu again
             input("\nPress Enter to continue...")
         
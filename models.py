@@ -14,8 +14,14 @@ class Employee:
     id: Optional[int] = None
     
     def __post_init__(self):
-        # Ensure salary is a Decimal for precise calculations
-        if not isinstance(self.salary, Decimal):
+        # Ensure salary is a Decimal for precise calculations; ints
+        # convert exactly without the str round-trip, only floats need
+        # stringifying to avoid binary-fraction artifacts
+        if isinstance(self.salary, Decimal):
+            return
+        if isinstance(self.salary, int):
+            self.salary = Decimal(self.salary)
+        else:
             self.salary = Decimal(str(self.salary))
     
     @property